@@ -1,14 +1,68 @@
-import geopandas as gpd
 import argparse
+import atexit
+import glob
+import io
 import os
-import time
 import json
+import threading
+from datetime import datetime
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from time import perf_counter
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+# Serialize JSON metrics straight to bytes with orjson when it is installed
+try:
+    import orjson
+    
+    def _dumps(record: Dict[str, Any]) -> bytes:
+        return orjson.dumps(record)
+except ImportError:
+    def _dumps(record: Dict[str, Any]) -> bytes:
+        return json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# geopandas, numpy, shapely and pyarrow are imported inside the functions that
+# use them so `--help` and metrics setup don't pay their import cost
+
+BYTES_TO_MB = 1.0 / 1048576.0
+
+# Bytes read per component file when warming the page cache for batch runs
+PREFETCH_BYTES = 65536
+
+# Supported output formats: name -> (file suffix, OGR driver or None for GeoParquet)
+OUTPUT_FORMATS = {
+    'geojson': ('.geojson', 'GeoJSON'),
+    # Newline-delimited GeoJSON (RFC 8142), streamed without FeatureCollection framing
+    'geojsonseq': ('.geojsonl', 'GeoJSONSeq'),
+    'parquet': ('.parquet', None),
+    'fgb': ('.fgb', 'FlatGeobuf'),
+}
+
+# Formats that can be written chunk by chunk without rewriting the output
+STREAMING_FORMATS = ('geojson', 'geojsonseq', 'parquet')
+
+# Text drivers that honour the COORDINATE_PRECISION layer option
+JSON_DRIVERS = ('GeoJSON', 'GeoJSONSeq')
+
+# Unicode line separators that JSON allows unescaped inside strings
+JSON_LINE_SEPARATORS = ('\x85', '\u2028', '\u2029')
+
+# Rows encoded per slice by the Point fast path, bounding its intermediate strings
+FAST_PATH_SLICE_ROWS = 65536
+
+# Geometry type names indexed by shapely.get_type_id
+GEOMETRY_TYPE_NAMES = (
+    'Point', 'LineString', 'LinearRing', 'Polygon',
+    'MultiPoint', 'MultiLineString', 'MultiPolygon', 'GeometryCollection',
+)
 
 # Abstract metrics interface
 class MetricsCollector(ABC):
+    # Collectors sit on the per-conversion hot path; slots keep attribute loads cheap
+    __slots__ = ()
+    
     @abstractmethod
     def record_conversion_start(self):
         pass
@@ -39,42 +93,71 @@ class MetricsCollector(ABC):
 
 # Prometheus implementation
 class PrometheusCollector(MetricsCollector):
-    def __init__(self, port: int = 8000):
-        from prometheus_client import Counter, Histogram, Gauge, start_http_server
+    __slots__ = (
+        'registry', 'pushgateway', 'conversion_counter', 'conversion_duration',
+        'read_duration', 'write_duration', 'feature_count_gauge',
+        'input_size_gauge', 'output_size_gauge',
+    )
+    
+    def __init__(self, port: int = 8000, pushgateway: Optional[str] = None):
+        from prometheus_client import CollectorRegistry, Counter, Histogram, Gauge, start_http_server
         
+        # Per-instance registry so a push carries only this job's samples
+        self.registry = CollectorRegistry()
+        self.pushgateway = pushgateway
         self.conversion_counter = Counter(
             'shapefile_conversions_total', 
             'Total number of shapefile conversions',
-            ['status']
+            ['status'],
+            registry=self.registry
         )
         self.conversion_duration = Histogram(
             'shapefile_conversion_duration_seconds', 
             'Time taken to convert shapefile',
-            buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+            buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+            registry=self.registry
         )
         self.read_duration = Histogram(
             'shapefile_read_duration_seconds',
-            'Time taken to read shapefile'
+            'Time taken to read shapefile',
+            registry=self.registry
         )
         self.write_duration = Histogram(
             'shapefile_write_duration_seconds',
-            'Time taken to write GeoJSON'
+            'Time taken to write GeoJSON',
+            registry=self.registry
         )
         self.feature_count_gauge = Gauge(
             'shapefile_feature_count', 
-            'Number of features in the shapefile'
+            'Number of features in the shapefile',
+            registry=self.registry
         )
         self.input_size_gauge = Gauge(
             'shapefile_input_size_mb',
-            'Input shapefile size in MB'
+            'Input shapefile size in MB',
+            registry=self.registry
         )
         self.output_size_gauge = Gauge(
             'shapefile_output_size_mb', 
-            'Output GeoJSON file size in MB'
+            'Output GeoJSON file size in MB',
+            registry=self.registry
         )
         
-        start_http_server(port)
-        print(f"Prometheus metrics available at http://localhost:{port}/metrics")
+        if pushgateway:
+            print(f"Prometheus metrics pushing to {pushgateway}")
+        else:
+            start_http_server(port, registry=self.registry)
+            print(f"Prometheus metrics available at http://localhost:{port}/metrics")
+    
+    def _push(self):
+        # One batched HTTP POST per conversion instead of a long-lived scrape server
+        # A transport failure must not fail (or double-count) a finished conversion
+        if self.pushgateway:
+            from prometheus_client import push_to_gateway
+            try:
+                push_to_gateway(self.pushgateway, job='geofile', registry=self.registry)
+            except Exception as e:
+                print(f"Failed to push metrics to {self.pushgateway}: {e}")
     
     def record_conversion_start(self):
         pass
@@ -82,9 +165,11 @@ class PrometheusCollector(MetricsCollector):
     def record_conversion_success(self, duration: float, metadata: Dict[str, Any]):
         self.conversion_counter.labels(status='success').inc()
         self.conversion_duration.observe(duration)
+        self._push()
     
     def record_conversion_failure(self, error: str):
         self.conversion_counter.labels(status='failure').inc()
+        self._push()
     
     def record_read_time(self, duration: float):
         self.read_duration.observe(duration)
@@ -101,38 +186,58 @@ class PrometheusCollector(MetricsCollector):
 
 # JSON logging implementation
 class JsonLogCollector(MetricsCollector):
-    def __init__(self, output_file: Optional[str] = None):
+    __slots__ = ('output_file', 'current_record', 'flush_interval', '_last_flush', '_fh')
+    
+    def __init__(self, output_file: Optional[str] = None, flush_interval: float = 0.25):
         self.output_file = output_file
         self.current_record = {}
+        self.flush_interval = flush_interval
+        self._last_flush = perf_counter()
+        # Keep one buffered handle open instead of open/append/close per record
+        self._fh = None
+        if output_file:
+            self._fh = open(output_file, 'ab', buffering=1 << 16)
+            atexit.register(self.close)
     
     def _write_record(self, record: Dict[str, Any]):
-        json_str = json.dumps(record)
-        if self.output_file:
-            with open(self.output_file, 'a') as f:
-                f.write(json_str + '\n')
+        json_bytes = _dumps(record)
+        if self._fh is not None:
+            self._fh.write(json_bytes + b'\n')
+            now = perf_counter()
+            if now - self._last_flush >= self.flush_interval:
+                self._fh.flush()
+                self._last_flush = now
         else:
-            print(json_str)
+            print(json_bytes.decode('utf-8'))
+    
+    def close(self):
+        """Flush buffered records and close the output file."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            atexit.unregister(self.close)
     
+    # current_record is reused across conversions rather than rebuilt per event
     def record_conversion_start(self):
-        self.current_record = {
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'event': 'conversion_start'
-        }
+        record = self.current_record
+        record.clear()
+        record['timestamp'] = datetime.now().isoformat(sep=' ', timespec='seconds')
+        record['event'] = 'conversion_start'
     
     def record_conversion_success(self, duration: float, metadata: Dict[str, Any]):
-        self.current_record.update({
-            'event': 'conversion_success',
-            'duration_seconds': duration,
-            **metadata
-        })
-        self._write_record(self.current_record)
+        record = self.current_record
+        record['event'] = 'conversion_success'
+        record['duration_seconds'] = duration
+        record.update(metadata)
+        self._write_record(record)
+        record.clear()
     
     def record_conversion_failure(self, error: str):
-        self.current_record.update({
-            'event': 'conversion_failure',
-            'error': error
-        })
-        self._write_record(self.current_record)
+        record = self.current_record
+        record['event'] = 'conversion_failure'
+        record['error'] = error
+        self._write_record(record)
+        record.clear()
     
     def record_read_time(self, duration: float):
         self.current_record['read_duration_seconds'] = duration
@@ -149,6 +254,8 @@ class JsonLogCollector(MetricsCollector):
 
 # Null collector (no metrics)
 class NullCollector(MetricsCollector):
+    __slots__ = ()
+    
     def record_conversion_start(self): pass
     def record_conversion_success(self, duration: float, metadata: Dict[str, Any]): pass
     def record_conversion_failure(self, error: str): pass
@@ -159,100 +266,491 @@ class NullCollector(MetricsCollector):
 
 # StatsD implementation
 class StatsDCollector(MetricsCollector):
+    __slots__ = ('client', '_pipe')
+    
     def __init__(self, host: str = 'localhost', port: int = 8125, prefix: str = 'shapefile'):
         try:
             from statsd import StatsClient
             self.client = StatsClient(host, port, prefix=prefix)
+            self._pipe = None
             print(f"StatsD metrics sending to {host}:{port}")
         except ImportError:
             print("statsd module not installed. Install with: pip install statsd")
             raise
     
+    def _sink(self):
+        # Buffer into the per-conversion pipeline when one is open
+        return self._pipe if self._pipe is not None else self.client
+    
+    def _send(self):
+        if self._pipe is not None:
+            self._pipe.send()
+            self._pipe = None
+    
     def record_conversion_start(self):
-        pass
+        # Coalesce all metrics for this conversion into one UDP packet
+        self._pipe = self.client.pipeline()
+    
+    def record_conversion_success(self, duration: float, metadata: Dict[str, Any]):
+        sink = self._sink()
+        sink.incr('conversion.success')
+        sink.timing('conversion.duration', duration * 1000)  # milliseconds
+        self._send()
+    
+    def record_conversion_failure(self, error: str):
+        self._sink().incr('conversion.failure')
+        self._send()
+    
+    def record_read_time(self, duration: float):
+        self._sink().timing('read.duration', duration * 1000)
+    
+    def record_write_time(self, duration: float):
+        self._sink().timing('write.duration', duration * 1000)
+    
+    def record_feature_count(self, count: int):
+        self._sink().gauge('feature.count', count)
+    
+    def record_file_sizes(self, input_mb: float, output_mb: float):
+        sink = self._sink()
+        sink.gauge('input.size_mb', input_mb)
+        sink.gauge('output.size_mb', output_mb)
+
+# Records metric calls so a worker process can hand them back to the parent
+# (replayed on arrival, so timestamps taken by the parent collector are arrival times)
+class _RecordingCollector(MetricsCollector):
+    __slots__ = ('events',)
+    
+    def __init__(self):
+        self.events = []
+    
+    def record_conversion_start(self):
+        self.events.append(('record_conversion_start', ()))
     
     def record_conversion_success(self, duration: float, metadata: Dict[str, Any]):
-        self.client.incr('conversion.success')
-        self.client.timing('conversion.duration', duration * 1000)  # milliseconds
+        self.events.append(('record_conversion_success', (duration, metadata)))
     
     def record_conversion_failure(self, error: str):
-        self.client.incr('conversion.failure')
+        self.events.append(('record_conversion_failure', (error,)))
     
     def record_read_time(self, duration: float):
-        self.client.timing('read.duration', duration * 1000)
+        self.events.append(('record_read_time', (duration,)))
     
     def record_write_time(self, duration: float):
-        self.client.timing('write.duration', duration * 1000)
+        self.events.append(('record_write_time', (duration,)))
     
     def record_feature_count(self, count: int):
-        self.client.gauge('feature.count', count)
+        self.events.append(('record_feature_count', (count,)))
     
     def record_file_sizes(self, input_mb: float, output_mb: float):
-        self.client.gauge('input.size_mb', input_mb)
-        self.client.gauge('output.size_mb', output_mb)
+        self.events.append(('record_file_sizes', (input_mb, output_mb)))
+
+@lru_cache(maxsize=None)
+def _io_options():
+    """
+    Return (engine, use_arrow) for geopandas I/O, probed once on first use.
+    
+    Prefers pyogrio's vectorized OGR bindings (falling back to fiona) and
+    streams records as Arrow batches when pyarrow and GDAL >= 3.6 are available.
+    """
+    try:
+        import pyogrio
+    except ImportError:
+        return 'fiona', False
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return 'pyogrio', False
+    return 'pyogrio', pyogrio.__gdal_version__ >= (3, 6, 0)
+
+def _read_chunks(input_path, chunk_size: Optional[int] = None,
+                 bbox: Optional[Tuple[float, float, float, float]] = None, where: Optional[str] = None):
+    """
+    Yield GeoDataFrames of at most chunk_size features (the whole file if None).
+    
+    bbox and where are pushed down to GDAL so filtered-out records are never materialized.
+    """
+    import geopandas as gpd
+    
+    io_engine, use_arrow = _io_options()
+    read_kwargs = {'use_arrow': True} if use_arrow else {}
+    if bbox is not None:
+        read_kwargs['bbox'] = bbox
+    if where is not None:
+        read_kwargs['where'] = where
+    if chunk_size is None:
+        yield gpd.read_file(input_path, engine=io_engine, **read_kwargs)
+        return
+    
+    if not use_arrow:
+        raise ValueError('chunked reads require pyogrio with pyarrow and GDAL >= 3.6')
+    import pyarrow as pa
+    import pyogrio
+    import shapely
+    
+    # One streaming reader, so bbox/where are evaluated in a single pass over the file
+    with pyogrio.open_arrow(input_path, batch_size=chunk_size, use_pyarrow=True,
+                            bbox=bbox, where=where) as (meta, reader):
+        geometry_column = meta['geometry_name'] or 'wkb_geometry'
+        columns = [name for name in reader.schema.names if name != geometry_column]
+        
+        def to_geodataframe(table):
+            geometry = shapely.from_wkb(table[geometry_column].to_numpy(zero_copy_only=False))
+            return gpd.GeoDataFrame(table.select(columns).to_pandas(), geometry=geometry,
+                                    crs=meta['crs'])
+        
+        empty = True
+        for batch in reader:
+            empty = False
+            yield to_geodataframe(pa.Table.from_batches([batch]))
+        # Always yield one frame so empty inputs still produce an output file
+        if empty:
+            yield to_geodataframe(reader.schema.empty_table())
+
+def _geoparquet_table(gdf):
+    """
+    Build a pyarrow Table with WKB geometry and GeoParquet 'geo' metadata.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    
+    geometry_column = gdf.geometry.name
+    table = pa.Table.from_pandas(pd.DataFrame(gdf.drop(columns=geometry_column)), preserve_index=False)
+    table = table.append_column(
+        geometry_column, pa.array(gdf.geometry.to_wkb(), type=pa.binary())
+    )
+    geo = {
+        'version': '1.0.0',
+        'primary_column': geometry_column,
+        'columns': {
+            geometry_column: {
+                'encoding': 'WKB',
+                'geometry_types': [],
+                'crs': gdf.crs.to_json_dict() if gdf.crs else None,
+            }
+        },
+    }
+    metadata = dict(table.schema.metadata or {})
+    metadata[b'geo'] = json.dumps(geo).encode('utf-8')
+    return table.replace_schema_metadata(metadata)
+
+def _geometry_type_counts(gdf):
+    """
+    Count geometries per type id with one vectorized pass over the geometry array.
+    """
+    import numpy as np
+    import shapely
+    
+    type_ids = shapely.get_type_id(np.asarray(gdf.geometry.values))
+    # Missing geometries have type id -1
+    return np.bincount(type_ids[type_ids >= 0], minlength=len(GEOMETRY_TYPE_NAMES))
+
+def _point_fast_path_eligible(gdf) -> bool:
+    """
+    Check whether a GeoDataFrame can be encoded by _iter_point_features.
+    
+    Requires non-empty 2D Points with finite coordinates and properties that
+    are all numeric or string; anything else GDAL would encode differently.
+    """
+    import numpy as np
+    import pandas as pd
+    import shapely
+    
+    geometries = np.asarray(gdf.geometry.values)
+    if not len(geometries) or not (shapely.get_type_id(geometries) == 0).all():
+        return False
+    if shapely.is_empty(geometries).any() or shapely.has_z(geometries).any():
+        return False
+    if not np.isfinite(shapely.get_coordinates(geometries)).all():
+        return False
+    for column in gdf.columns:
+        if column == gdf.geometry.name:
+            continue
+        series = gdf[column]
+        if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_string_dtype(series)):
+            return False
+    return True
 
-def convert_shapefile(input_path, output_path=None, metrics: MetricsCollector = None):
+def _iter_point_features(gdf, coord_precision: Optional[int], separator: str) -> Iterator[str]:
     """
-    Convert a shapefile to GeoJSON with optional metrics collection.
+    Encode an eligible Point GeoDataFrame as GeoJSON Feature strings in bulk.
+    
+    Coordinates come from shapely.get_coordinates and properties from
+    DataFrame.to_json, skipping GDAL's per-feature geometry dispatch. Rows are
+    encoded FAST_PATH_SLICE_ROWS at a time so only one slice's text is held in
+    memory; each yielded slice joins its features with separator and, after
+    the first, starts with it too.
+    """
+    import numpy as np
+    import pandas as pd
+    import shapely
+    
+    template = '{"type":"Feature","properties":%s,"geometry":{"type":"Point","coordinates":[%r,%r]}}'
+    geometry_name = gdf.geometry.name
+    for start in range(0, len(gdf), FAST_PATH_SLICE_ROWS):
+        part = gdf.iloc[start:start + FAST_PATH_SLICE_ROWS]
+        coordinates = shapely.get_coordinates(np.asarray(part.geometry.values))
+        if coord_precision is not None:
+            coordinates = np.round(coordinates, coord_precision)
+        
+        properties = pd.DataFrame(part.drop(columns=geometry_name))
+        if len(properties.columns):
+            records = properties.to_json(
+                orient='records', lines=True, force_ascii=False, double_precision=15
+            )
+            # pandas leaves U+0085/U+2028/U+2029 raw inside strings; escape them so no
+            # line-oriented reader splits a record. Real newlines are always escaped.
+            for line_separator in JSON_LINE_SEPARATORS:
+                records = records.replace(line_separator, '\\u%04x' % ord(line_separator))
+            property_lines = records.rstrip('\n').split('\n')
+            del records
+            # Earlier slices may already be written, so this can't fall back to GDAL
+            if len(property_lines) != len(coordinates):
+                raise ValueError(
+                    f"Encoded {len(property_lines)} property records for {len(coordinates)} points"
+                )
+        else:
+            property_lines = ['{}'] * len(properties)
+        
+        text = separator.join(
+            template % feature
+            for feature in zip(property_lines, coordinates[:, 0].tolist(), coordinates[:, 1].tolist())
+        )
+        yield separator + text if start else text
+
+@lru_cache(maxsize=None)
+def _gdal_version() -> Tuple[int, ...]:
+    """
+    Return the version of the GDAL library geopandas writes through.
+    """
+    if _io_options()[0] == 'pyogrio':
+        import pyogrio
+        return tuple(pyogrio.__gdal_version__)
+    import fiona
+    return tuple(int(part) for part in fiona.__gdal_version__.split('.')[:3])
+
+def _geojson_header(output_path: str, crs, coord_precision: Optional[int] = None) -> Optional[str]:
+    """
+    Build the FeatureCollection preamble GDAL would write, or None if the CRS has no URN.
+    """
+    name = os.path.splitext(os.path.basename(output_path))[0]
+    header = '{\n"type": "FeatureCollection",\n"name": %s,\n' % json.dumps(name)
+    if crs is not None:
+        epsg = crs.to_epsg()
+        if epsg is None:
+            return None
+        urn = 'urn:ogc:def:crs:OGC:1.3:CRS84' if epsg == 4326 else f'urn:ogc:def:crs:EPSG::{epsg}'
+        header += '"crs": { "type": "name", "properties": { "name": "%s" } },\n' % urn
+    # GDAL >= 3.9 records COORDINATE_PRECISION as the collection's coordinate resolution
+    if coord_precision is not None and _gdal_version() >= (3, 9, 0):
+        header += '"xy_coordinate_resolution": %g,\n' % (10.0 ** -coord_precision)
+    return header + '"features": [\n'
+
+def _geojson_chunk(gdf, output_path: str, io_engine: str, coord_precision: Optional[int],
+                   write_options: Dict[str, Any]) -> Tuple[str, Iterator[str]]:
+    """
+    Encode a chunk as (FeatureCollection header, comma-separated feature line slices).
+    """
+    header = _geojson_header(output_path, gdf.crs, coord_precision)
+    if header is not None and _point_fast_path_eligible(gdf):
+        return header, _iter_point_features(gdf, coord_precision, ',\n')
+    
+    # GDAL writes one feature per line between the '"features": [' and ']' lines
+    layer = os.path.splitext(os.path.basename(output_path))[0]
+    buffer = io.BytesIO()
+    gdf.to_file(buffer, driver='GeoJSON', engine=io_engine, layer=layer, **write_options)
+    text = buffer.getvalue().decode('utf-8')
+    marker = '"features": [\n'
+    start = text.index(marker) + len(marker)
+    end = text.rindex('\n]')
+    body = text[start:end].strip('\n')
+    return text[:start], iter([body] if body else [])
+
+def convert_shapefile(input_path, output_path=None, metrics: MetricsCollector = None,
+                      output_format: str = 'geojson', chunk_size: Optional[int] = None,
+                      verbose: bool = False, coord_precision: Optional[int] = 7,
+                      bbox: Optional[Tuple[float, float, float, float]] = None,
+                      where: Optional[str] = None):
+    """
+    Convert a shapefile to GeoJSON (or GeoJSONSeq/GeoParquet/FlatGeobuf) with optional metrics collection.
     
     Args:
         input_path: Full path to the input .shp file
-        output_path: Full path to output .geojson file (optional)
+        output_path: Full path to output file (optional, suffix derived from output_format)
         metrics: MetricsCollector instance for recording metrics
+        output_format: One of 'geojson', 'geojsonseq', 'parquet' or 'fgb' (default: geojson)
+        chunk_size: Number of features to read and write per batch (optional, reads whole file if None;
+            requires pyogrio with pyarrow and is not supported for fgb output)
+        verbose: Print CRS and geometry type counts
+        coord_precision: Decimal places for GeoJSON coordinates (default: 7, ~1 cm in degrees;
+            None keeps the driver default)
+        bbox: Only read features intersecting (minx, miny, maxx, maxy) (optional)
+        where: OGR SQL WHERE clause to filter features at read time (optional)
     """
+    import numpy as np
+    
     if metrics is None:
         metrics = NullCollector()
     
     metrics.record_conversion_start()
-    total_start = time.time()
+    total_start = perf_counter()
     
     try:
-        # Generate output path if not provided
+        suffix, driver = OUTPUT_FORMATS[output_format]
+        io_engine = _io_options()[0]
+        if chunk_size is not None and output_format not in STREAMING_FORMATS:
+            raise ValueError(f"chunk_size is not supported for {output_format} output")
+        
+        # Let GDAL format fewer digits instead of full double precision
+        write_options = {}
+        if driver in JSON_DRIVERS and coord_precision is not None:
+            write_options['COORDINATE_PRECISION'] = coord_precision
+        
+        # Keep paths as plain strings; swap the .shp suffix without building Path objects
+        input_path = os.fspath(input_path)
         if output_path is None:
-            input_file = Path(input_path)
-            output_path = input_file.with_suffix('.geojson')
+            if input_path.lower().endswith('.shp'):
+                output_path = input_path[:-4] + suffix
+            else:
+                output_path = str(Path(input_path).with_suffix(suffix))
+        else:
+            output_path = os.fspath(output_path)
         
         # Record input file size
-        input_size_mb = os.path.getsize(input_path) / 1024 / 1024
+        input_size_mb = os.stat(input_path).st_size * BYTES_TO_MB
+        
+        # Read and write in chunks so peak memory is bounded by chunk_size
+        chunks = _read_chunks(input_path, chunk_size, bbox=bbox, where=where)
+        read_time = 0.0
+        write_time = 0.0
+        feature_count = 0
+        geometry_type_counts = np.zeros(len(GEOMETRY_TYPE_NAMES), dtype=np.int64)
+        crs = None
+        # Files we stream into ourselves report their size via tell(), no stat needed
+        output_file = None
+        output_bytes = None
+        has_features = False
+        parquet_writer = None
+        try:
+            while True:
+                read_start = perf_counter()
+                gdf = next(chunks, None)
+                read_time += perf_counter() - read_start
+                if gdf is None:
+                    break
+                
+                feature_count += len(gdf)
+                if verbose:
+                    geometry_type_counts += _geometry_type_counts(gdf)
+                crs = gdf.crs
+                
+                write_start = perf_counter()
+                if driver == 'GeoJSON' and chunk_size is not None:
+                    # Stream one FeatureCollection through our own handle; GDAL's append
+                    # mode rewrites the whole file on every chunk
+                    header, body = _geojson_chunk(gdf, output_path, io_engine, coord_precision,
+                                                  write_options)
+                    if output_file is None:
+                        output_file = open(output_path, 'wb')
+                        output_file.write(header.encode('utf-8'))
+                    for index, part in enumerate(body):
+                        if index == 0 and has_features:
+                            output_file.write(b',\n')
+                        output_file.write(part.encode('utf-8'))
+                        has_features = True
+                    write_time += perf_counter() - write_start
+                    continue
+                
+                # Single-type Point frames skip GDAL's per-feature writer. GeoJSONSeq is
+                # only specialized for WGS84 since GDAL would otherwise reproject it.
+                fast_path = False
+                header = None
+                if driver == 'GeoJSON':
+                    header = _geojson_header(output_path, gdf.crs, coord_precision)
+                    fast_path = header is not None and _point_fast_path_eligible(gdf)
+                elif driver == 'GeoJSONSeq' and (gdf.crs is None or gdf.crs.to_epsg() == 4326):
+                    fast_path = _point_fast_path_eligible(gdf)
+                
+                if fast_path:
+                    if output_file is None:
+                        output_file = open(output_path, 'wb')
+                    # Header, feature slices and footer are written separately so the
+                    # full document is never built as one string
+                    if header is not None:
+                        output_file.write(header.encode('utf-8'))
+                        separator, footer = ',\n', b'\n]\n}\n'
+                    else:
+                        separator, footer = '\n', b'\n'
+                    for part in _iter_point_features(gdf, coord_precision, separator):
+                        output_file.write(part.encode('utf-8'))
+                    output_file.write(footer)
+                elif driver == 'GeoJSONSeq' and chunk_size is not None:
+                    # Stream each chunk's encoded lines into one handle; GDAL's append
+                    # mode can reopen a one-feature GeoJSONSeq file as plain GeoJSON
+                    if output_file is None:
+                        output_file = open(output_path, 'wb')
+                    # GDAL can't encode an empty frame in memory; the empty file is the output
+                    if len(gdf):
+                        buffer = io.BytesIO()
+                        gdf.to_file(buffer, driver=driver, engine=io_engine, **write_options)
+                        output_file.write(buffer.getbuffer())
+                elif driver is not None:
+                    gdf.to_file(output_path, driver=driver, engine=io_engine, **write_options)
+                elif chunk_size is None:
+                    gdf.to_parquet(output_path, compression='zstd')
+                else:
+                    table = _geoparquet_table(gdf)
+                    if parquet_writer is None:
+                        import pyarrow as pa
+                        import pyarrow.parquet as pq
+                        output_file = pa.OSFile(output_path, 'wb')
+                        parquet_writer = pq.ParquetWriter(output_file, table.schema, compression='zstd')
+                    parquet_writer.write_table(table.cast(parquet_writer.schema))
+                write_time += perf_counter() - write_start
+            
+            if driver == 'GeoJSON' and chunk_size is not None and output_file is not None:
+                output_file.write(b'\n]\n}\n')
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+            if output_file is not None:
+                output_bytes = output_file.tell()
+                output_file.close()
         
-        # Read shapefile
-        read_start = time.time()
-        gdf = gpd.read_file(input_path)
-        read_time = time.time() - read_start
         metrics.record_read_time(read_time)
+        metrics.record_write_time(write_time)
         
         # Record feature count
-        feature_count = len(gdf)
         metrics.record_feature_count(feature_count)
         
         print(f"Read {feature_count} features in {read_time:.2f}s")
-        print(f"CRS: {gdf.crs}")
-        print(f"Geometry types: {gdf.geometry.type.value_counts().to_dict()}")
-        
-        # Write GeoJSON
-        write_start = time.time()
-        gdf.to_file(output_path, driver='GeoJSON')
-        write_time = time.time() - write_start
-        metrics.record_write_time(write_time)
+        if verbose:
+            print(f"CRS: {crs}")
+            geometry_types = {
+                name: int(count)
+                for name, count in zip(GEOMETRY_TYPE_NAMES, geometry_type_counts) if count
+            }
+            print(f"Geometry types: {geometry_types}")
         
         # Record output file size
-        output_size_mb = os.path.getsize(output_path) / 1024 / 1024
+        if output_bytes is None:
+            output_bytes = os.stat(output_path).st_size
+        output_size_mb = output_bytes * BYTES_TO_MB
         metrics.record_file_sizes(input_size_mb, output_size_mb)
         
         # Record total duration
-        total_time = time.time() - total_start
+        total_time = perf_counter() - total_start
         
         metadata = {
-            'input_file': str(input_path),
-            'output_file': str(output_path),
+            'input_file': input_path,
+            'output_file': output_path,
             'feature_count': feature_count,
             'input_size_mb': input_size_mb,
             'output_size_mb': output_size_mb,
-            'crs': str(gdf.crs)
+            'crs': str(crs)
         }
         metrics.record_conversion_success(total_time, metadata)
         
-        print(f"Wrote GeoJSON in {write_time:.2f}s")
+        print(f"Wrote {output_format} in {write_time:.2f}s")
         print(f"Total conversion time: {total_time:.2f}s")
         print(f"Output file: {output_path} ({output_size_mb:.2f} MB)")
         
@@ -263,17 +761,144 @@ def convert_shapefile(input_path, output_path=None, metrics: MetricsCollector =
         print(f"Error during conversion: {str(e)}")
         raise
 
+def _warm_page_cache(input_paths):
+    """
+    Read the head of each shapefile's component files ahead of the workers.
+    """
+    for input_path in input_paths:
+        base = os.path.splitext(input_path)[0]
+        for ext in ('.shp', '.shx', '.dbf'):
+            try:
+                with open(base + ext, 'rb') as f:
+                    f.read(PREFETCH_BYTES)
+            except OSError:
+                pass
+
+def _convert_one(task):
+    input_path, output_format, chunk_size, verbose, coord_precision, bbox, where = task
+    recorder = _RecordingCollector()
+    try:
+        convert_shapefile(input_path, metrics=recorder, output_format=output_format,
+                          chunk_size=chunk_size, verbose=verbose, coord_precision=coord_precision,
+                          bbox=bbox, where=where)
+        error = None
+    except Exception as e:
+        error = str(e)
+    return input_path, recorder.events, error
+
+def convert_many(input_paths, metrics: MetricsCollector = None, output_format: str = 'geojson',
+                 chunk_size: Optional[int] = None, processes: Optional[int] = None,
+                 verbose: bool = False, coord_precision: Optional[int] = 7,
+                 bbox: Optional[Tuple[float, float, float, float]] = None,
+                 where: Optional[str] = None):
+    """
+    Convert several shapefiles in parallel, one worker process per file.
+    
+    Output paths are derived from each input path. Metrics recorded in the
+    workers are replayed into the given collector in the parent process as
+    each file finishes, so time-of-event fields such as JsonLogCollector's
+    'timestamp' reflect when the result arrived, not when the conversion began.
+    
+    Args:
+        input_paths: Paths to the input .shp files
+        metrics: MetricsCollector instance for recording metrics
+        output_format: One of 'geojson', 'geojsonseq', 'parquet' or 'fgb' (default: geojson)
+        chunk_size: Number of features to read and write per batch (optional)
+        processes: Number of worker processes (default: min(cpu_count, len(input_paths)))
+        verbose: Print CRS and geometry type counts for each file
+        coord_precision: Decimal places for GeoJSON coordinates (default: 7)
+        bbox: Only read features intersecting (minx, miny, maxx, maxy) (optional)
+        where: OGR SQL WHERE clause to filter features at read time (optional)
+    
+    Returns:
+        Dict mapping each failed input path to its error message
+    """
+    if metrics is None:
+        metrics = NullCollector()
+    if processes is None:
+        processes = min(cpu_count(), len(input_paths))
+    
+    # Import geopandas once in the parent so forked workers inherit it
+    import geopandas  # noqa: F401
+    _io_options()
+    
+    failures = {}
+    tasks = [
+        (input_path, output_format, chunk_size, verbose, coord_precision, bbox, where)
+        for input_path in input_paths
+    ]
+    with Pool(processes=max(processes, 1)) as pool:
+        # Warm the page cache serially so workers don't contend on cold reads. Started
+        # only after the workers are forked, since forking a threaded process is unsafe.
+        threading.Thread(target=_warm_page_cache, args=(input_paths,), daemon=True).start()
+        for input_path, events, error in pool.imap_unordered(_convert_one, tasks):
+            for name, event_args in events:
+                getattr(metrics, name)(*event_args)
+            if error is not None:
+                failures[input_path] = error
+    
+    print(f"Converted {len(input_paths) - len(failures)}/{len(input_paths)} files")
+    return failures
+
+def _parse_bbox(value: str) -> Tuple[float, float, float, float]:
+    try:
+        minx, miny, maxx, maxy = (float(part) for part in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected minx,miny,maxx,maxy, got '{value}'")
+    return minx, miny, maxx, maxy
+
 def main():
     parser = argparse.ArgumentParser(
-        description='Convert shapefile to GeoJSON with optional metrics'
+        description='Convert shapefile to GeoJSON, GeoJSONSeq, GeoParquet or FlatGeobuf with optional metrics'
     )
     parser.add_argument(
         'input',
-        help='Path to input shapefile (e.g., AZ649/spatial/soilmu_a_az649.shp)'
+        nargs='+',
+        help='Path(s) or glob(s) of input shapefiles (e.g., AZ649/spatial/soilmu_a_az649.shp)'
     )
     parser.add_argument(
         '-o', '--output',
-        help='Path to output GeoJSON file (optional)'
+        help='Path to output file (optional, single input only)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Worker processes for multiple inputs (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=list(OUTPUT_FORMATS),
+        default='geojson',
+        help='Output format; geojsonseq writes one feature per line (RFC 8142) (default: geojson)'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        help='Number of features to read and write per batch (default: whole file; '
+             'requires pyarrow, not supported for fgb)'
+    )
+    parser.add_argument(
+        '--bbox',
+        type=_parse_bbox,
+        metavar='MINX,MINY,MAXX,MAXY',
+        help='Only convert features intersecting this bounding box (in the input CRS)'
+    )
+    parser.add_argument(
+        '--where',
+        metavar='SQL',
+        help='OGR SQL WHERE clause to filter features (e.g., "STATE = \'AZ\'")'
+    )
+    parser.add_argument(
+        '--coord-precision',
+        type=int,
+        default=7,
+        metavar='N',
+        help='Decimal places for GeoJSON/GeoJSONSeq coordinates (default: 7)'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Print CRS and geometry type counts'
     )
     parser.add_argument(
         '--metrics',
@@ -287,6 +912,11 @@ def main():
         default=8000,
         help='Port for Prometheus metrics server (default: 8000)'
     )
+    parser.add_argument(
+        '--prometheus-pushgateway',
+        metavar='URL',
+        help='Push Prometheus metrics to this Pushgateway instead of serving them'
+    )
     parser.add_argument(
         '--metrics-file',
         help='Output file for JSON metrics'
@@ -305,10 +935,23 @@ def main():
     
     args = parser.parse_args()
     
+    # Expand globs the shell left unexpanded (e.g. quoted patterns)
+    input_paths = []
+    for pattern in args.input:
+        input_paths.extend(sorted(glob.glob(pattern)) or [pattern])
+    if len(input_paths) > 1 and args.output:
+        parser.error('--output cannot be used with multiple inputs')
+    if args.chunk_size is not None and args.format not in STREAMING_FORMATS:
+        parser.error(f'--chunk-size is not supported for {args.format} output')
+    if args.chunk_size is not None and not _io_options()[1]:
+        parser.error('--chunk-size requires pyarrow (pip install "geofile[parquet]") '
+                     'and pyogrio with GDAL >= 3.6')
+    
     # Create appropriate metrics collector
     if args.metrics == 'prometheus':
         try:
-            metrics = PrometheusCollector(port=args.metrics_port)
+            metrics = PrometheusCollector(port=args.metrics_port,
+                                          pushgateway=args.prometheus_pushgateway)
         except ImportError:
             print("prometheus-client not installed. Install with: pip install prometheus-client")
             return
@@ -323,8 +966,20 @@ def main():
     else:
         metrics = NullCollector()
     
+    if len(input_paths) > 1:
+        failures = convert_many(input_paths, metrics, output_format=args.format,
+                                chunk_size=args.chunk_size, processes=args.jobs,
+                                verbose=args.verbose, coord_precision=args.coord_precision,
+                                bbox=args.bbox, where=args.where)
+        if failures:
+            parser.exit(1, f"{len(failures)} of {len(input_paths)} conversions failed: "
+                           f"{', '.join(sorted(failures))}\n")
+        return
+    
     # Convert the file
-    convert_shapefile(args.input, args.output, metrics)
+    convert_shapefile(input_paths[0], args.output, metrics, output_format=args.format,
+                      chunk_size=args.chunk_size, verbose=args.verbose,
+                      coord_precision=args.coord_precision, bbox=args.bbox, where=args.where)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
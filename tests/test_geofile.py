@@ -7,6 +7,10 @@ from pathlib import Path
 from shapely.geometry import Point, Polygon, LineString
 import shutil
 
+from geofile.geofile import (
+    convert_shapefile, convert_many, main, JsonLogCollector, PrometheusCollector, StatsDCollector
+)
+
 # Import your converter module (adjust import based on your file name)
 # from convert import convert_shapefile, MetricsCollector, NullCollector, JsonLogCollector
 
@@ -306,6 +310,110 @@ class TestMetricsCollection:
             data = json.loads(line)
             assert data['feature_count'] == 3
             assert data['duration_seconds'] == 1.5
+    
+    def test_json_log_collector_file(self, sample_point_shapefile, temp_dir):
+        """Test that JsonLogCollector appends one record per conversion"""
+        shp_path, _ = sample_point_shapefile
+        metrics_file = os.path.join(temp_dir, 'metrics.jsonl')
+        
+        metrics = JsonLogCollector(output_file=metrics_file)
+        convert_shapefile(shp_path, os.path.join(temp_dir, 'a.geojson'), metrics)
+        convert_shapefile(shp_path, os.path.join(temp_dir, 'b.geojson'), metrics)
+        metrics.close()
+        
+        with open(metrics_file, 'r') as f:
+            records = [json.loads(line) for line in f]
+        assert len(records) == 2
+        assert all(r['event'] == 'conversion_success' for r in records)
+        assert all(r['feature_count'] == 3 for r in records)
+    
+    def test_json_log_collector_unicode(self, temp_dir):
+        """Test that non-ASCII metadata is written as raw UTF-8 with or without orjson"""
+        metrics_file = os.path.join(temp_dir, 'metrics.jsonl')
+        
+        metrics = JsonLogCollector(output_file=metrics_file)
+        metrics.record_conversion_start()
+        metrics.record_conversion_success(1.0, {'input_file': 'données/café.shp'})
+        metrics.close()
+        
+        with open(metrics_file, 'rb') as f:
+            line = f.read()
+        assert 'données/café.shp'.encode('utf-8') in line
+        assert json.loads(line)['input_file'] == 'données/café.shp'
+    
+    def test_statsd_single_packet(self, sample_point_shapefile, temp_dir):
+        """Test that StatsDCollector sends one datagram per conversion"""
+        pytest.importorskip('statsd')
+        import socket
+        shp_path, _ = sample_point_shapefile
+        
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('127.0.0.1', 0))
+        sock.settimeout(2)
+        try:
+            metrics = StatsDCollector(host='127.0.0.1', port=sock.getsockname()[1])
+            convert_shapefile(shp_path, os.path.join(temp_dir, 'output.geojson'), metrics)
+            
+            packet = sock.recv(65536).decode()
+            assert 'shapefile.conversion.success:1|c' in packet
+            assert 'shapefile.feature.count:3|g' in packet
+            sock.settimeout(0.1)
+            with pytest.raises(socket.timeout):
+                sock.recv(65536)
+        finally:
+            sock.close()
+    
+    def test_prometheus_pushgateway(self, sample_point_shapefile, temp_dir):
+        """Test that PrometheusCollector pushes once per conversion"""
+        pytest.importorskip('prometheus_client')
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        shp_path, _ = sample_point_shapefile
+        pushes = []
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_PUT(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                pushes.append((self.path, body.decode()))
+                self.send_response(200)
+                self.end_headers()
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            metrics = PrometheusCollector(pushgateway=f'127.0.0.1:{server.server_port}')
+            convert_shapefile(shp_path, os.path.join(temp_dir, 'output.geojson'), metrics)
+        finally:
+            server.shutdown()
+        
+        assert len(pushes) == 1
+        path, body = pushes[0]
+        assert path == '/metrics/job/geofile'
+        assert 'shapefile_conversions_total{status="success"} 1.0' in body
+    
+    def test_prometheus_pushgateway_unreachable(self, sample_point_shapefile, temp_dir, capsys):
+        """Test that a failed push neither fails nor double-counts the conversion"""
+        pytest.importorskip('prometheus_client')
+        import socket
+        from prometheus_client import generate_latest
+        shp_path, _ = sample_point_shapefile
+        
+        # Reserve a local port with nothing listening on it
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        
+        metrics = PrometheusCollector(pushgateway=f'127.0.0.1:{port}')
+        assert convert_shapefile(shp_path, os.path.join(temp_dir, 'output.geojson'), metrics)
+        
+        exposition = generate_latest(metrics.registry).decode()
+        assert 'shapefile_conversions_total{status="success"} 1.0' in exposition
+        assert 'status="failure"' not in exposition
+        assert 'Failed to push metrics' in capsys.readouterr().out
 
 
 class TestOutputFormat:
@@ -377,6 +485,279 @@ class TestRegressionBaseline:
         assert set(result_gdf.columns) == set(baseline_metrics['columns'])
 
 
+class TestConvertShapefile:
+    """Test the convert_shapefile entry point"""
+    
+    def test_convert_shapefile_geojson(self, sample_point_shapefile, temp_dir):
+        """Test converting through convert_shapefile with metrics"""
+        shp_path, original_gdf = sample_point_shapefile
+        output_path = os.path.join(temp_dir, 'output.geojson')
+        
+        metrics = MockMetricsCollector()
+        assert convert_shapefile(shp_path, output_path, metrics)
+        
+        result_gdf = gpd.read_file(output_path)
+        assert len(result_gdf) == len(original_gdf)
+        assert list(result_gdf['name']) == list(original_gdf['name'])
+        assert ('feature_count', 3) in metrics.events
+        metadata = next(event[2] for event in metrics.events if event[0] == 'success')
+        assert metadata['input_file'] == shp_path
+        assert metadata['output_file'] == output_path
+    
+    def test_convert_shapefile_verbose(self, sample_polygon_shapefile, temp_dir, capsys):
+        """Test that geometry type counts are printed only when verbose"""
+        shp_path, _ = sample_polygon_shapefile
+        output_path = os.path.join(temp_dir, 'output.geojson')
+        
+        convert_shapefile(shp_path, output_path)
+        assert 'Geometry types' not in capsys.readouterr().out
+        
+        convert_shapefile(shp_path, output_path, verbose=True)
+        assert "Geometry types: {'Polygon': 2}" in capsys.readouterr().out
+    
+    @pytest.mark.parametrize('output_format, suffix', [('parquet', '.parquet'), ('fgb', '.fgb')])
+    def test_convert_shapefile_formats(self, sample_polygon_shapefile, output_format, suffix):
+        """Test binary output formats and suffix derivation"""
+        if output_format == 'parquet':
+            pytest.importorskip('pyarrow')
+        shp_path, original_gdf = sample_polygon_shapefile
+        
+        convert_shapefile(shp_path, output_format=output_format)
+        
+        output_path = Path(shp_path).with_suffix(suffix)
+        if output_format == 'parquet':
+            result_gdf = gpd.read_parquet(output_path)
+        else:
+            result_gdf = gpd.read_file(output_path)
+        assert len(result_gdf) == len(original_gdf)
+        assert result_gdf.crs == original_gdf.crs
+        # FlatGeobuf orders features by its spatial index
+        assert sorted(result_gdf['region']) == sorted(original_gdf['region'])
+    
+    def test_convert_shapefile_coord_precision(self, temp_dir):
+        """Test that GeoJSON coordinates are rounded to coord_precision"""
+        gdf = gpd.GeoDataFrame(
+            {'name': ['A'], 'geometry': [Point(-122.419412345678, 37.774912345678)]},
+            crs='EPSG:4326'
+        )
+        shp_path = os.path.join(temp_dir, 'precise.shp')
+        gdf.to_file(shp_path)
+        output_path = os.path.join(temp_dir, 'output.geojson')
+        
+        convert_shapefile(shp_path, output_path, coord_precision=3)
+        
+        with open(output_path, 'r') as f:
+            geojson = json.load(f)
+        assert geojson['features'][0]['geometry']['coordinates'] == [-122.419, 37.775]
+    
+    @pytest.mark.parametrize('chunk_size', [None, 1])
+    def test_convert_shapefile_filters(self, sample_point_shapefile, temp_dir, chunk_size):
+        """Test that bbox and where filters are applied at read time"""
+        shp_path, _ = sample_point_shapefile
+        output_path = os.path.join(temp_dir, 'output.geojson')
+        
+        convert_shapefile(shp_path, output_path, chunk_size=chunk_size,
+                          bbox=(-125, 30, -100, 45))
+        assert list(gpd.read_file(output_path)['name']) == ['Location A', 'Location B']
+        
+        convert_shapefile(shp_path, output_path, chunk_size=chunk_size,
+                          bbox=(-125, 30, -100, 45), where='value > 150')
+        assert list(gpd.read_file(output_path)['name']) == ['Location B']
+    
+    @pytest.mark.parametrize('chunk_size', [None, 2])
+    @pytest.mark.parametrize('output_format, crs', [
+        ('geojson', 'EPSG:4326'),
+        ('geojson', 'EPSG:3857'),
+        ('geojsonseq', 'EPSG:4326'),
+    ])
+    def test_convert_shapefile_point_fast_path(self, temp_dir, output_format, crs, chunk_size,
+                                               monkeypatch):
+        """Test that the bulk Point encoder matches GDAL's output feature by feature"""
+        # Force several encode slices per chunk
+        monkeypatch.setattr('geofile.geofile.FAST_PATH_SLICE_ROWS', 2)
+        gdf = gpd.GeoDataFrame(
+            {'name': ['Café', None, '日本語 "quoted"', 'a\x85b', 'x\u2028y\u2029z'],
+             'value': [1.5, float('nan'), 1e-7, -2.25, 0.0],
+             'count': [1, 2, 3, 4, 5],
+             'geometry': [Point(-122.4194, 37.7749), Point(0, 0), Point(1e6, -1e-6),
+                          Point(1, 2), Point(3, 4)]},
+            crs=crs
+        )
+        shp_path = os.path.join(temp_dir, 'points.shp')
+        gdf.to_file(shp_path)
+        output_path = os.path.join(temp_dir, 'points.out')
+        os.makedirs(os.path.join(temp_dir, 'expected'))
+        expected_path = os.path.join(temp_dir, 'expected', 'points.out')
+        
+        convert_shapefile(shp_path, output_path, output_format=output_format,
+                          chunk_size=chunk_size)
+        driver = 'GeoJSON' if output_format == 'geojson' else 'GeoJSONSeq'
+        gpd.read_file(shp_path).to_file(expected_path, driver=driver, COORDINATE_PRECISION=7)
+        
+        def read_features(path):
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                text = f.read()
+            if output_format == 'geojson':
+                return json.loads(text)['features']
+            return [json.loads(line) for line in text.split('\n') if line.strip()]
+        
+        with open(output_path, 'r', encoding='utf-8') as f:
+            result_text = f.read()
+        assert '"properties":{' in result_text
+        if output_format == 'geojson':
+            with open(expected_path, 'r', encoding='utf-8') as f:
+                expected_text = f.read()
+            marker = '"features": [\n'
+            assert result_text[:result_text.index(marker)] == expected_text[:expected_text.index(marker)]
+        result_features = read_features(output_path)
+        expected_features = read_features(expected_path)
+        assert len(result_features) == len(expected_features) == 5
+        for result, expected in zip(result_features, expected_features):
+            assert result['properties'] == expected['properties']
+            assert result['geometry'] == expected['geometry']
+        
+        result_gdf = gpd.read_file(output_path)
+        assert result_gdf.crs == gpd.read_file(shp_path).crs
+        assert list(result_gdf['name']) == list(gdf['name'])
+    
+    def test_convert_shapefile_geojsonseq(self, sample_point_shapefile):
+        """Test newline-delimited GeoJSON output"""
+        shp_path, original_gdf = sample_point_shapefile
+        
+        convert_shapefile(shp_path, output_format='geojsonseq')
+        
+        output_path = Path(shp_path).with_suffix('.geojsonl')
+        with open(output_path, 'r') as f:
+            features = [json.loads(line) for line in f if line.strip()]
+        assert len(features) == 3
+        assert all(feature['type'] == 'Feature' for feature in features)
+        
+        result_gdf = gpd.read_file(output_path)
+        assert list(result_gdf['name']) == list(original_gdf['name'])
+    
+    @pytest.mark.parametrize('output_format, suffix, chunk_size', [
+        ('geojson', '.geojson', 10),
+        ('geojsonseq', '.geojsonl', 1),
+        ('parquet', '.parquet', 10),
+    ])
+    def test_convert_shapefile_chunked(self, temp_dir, output_format, suffix, chunk_size):
+        """Test that chunked conversion writes every feature"""
+        if output_format == 'parquet':
+            pytest.importorskip('pyarrow')
+        n_features = 25
+        gdf = gpd.GeoDataFrame(
+            {'id': list(range(n_features)),
+             'geometry': [Point(i * 0.01, i * 0.01) for i in range(n_features)]},
+            crs='EPSG:4326'
+        )
+        shp_path = os.path.join(temp_dir, 'chunked.shp')
+        gdf.to_file(shp_path)
+        
+        metrics = MockMetricsCollector()
+        convert_shapefile(shp_path, metrics=metrics, output_format=output_format,
+                          chunk_size=chunk_size)
+        
+        output_path = os.path.join(temp_dir, 'chunked' + suffix)
+        if output_format == 'parquet':
+            result_gdf = gpd.read_parquet(output_path)
+        else:
+            result_gdf = gpd.read_file(output_path)
+        assert list(result_gdf['id']) == list(range(n_features))
+        assert result_gdf.crs == gdf.crs
+        assert ('feature_count', n_features) in metrics.events
+        file_sizes = next(event for event in metrics.events if event[0] == 'file_sizes')
+        assert file_sizes[2] * 1048576 == os.path.getsize(output_path)
+        
+        # A filter matching nothing still produces an (empty) output file
+        empty_path = os.path.join(temp_dir, 'empty' + suffix)
+        convert_shapefile(shp_path, empty_path, output_format=output_format,
+                          chunk_size=chunk_size, bbox=(100, 100, 101, 101))
+        if output_format == 'geojsonseq':
+            assert os.path.getsize(empty_path) == 0
+        elif output_format == 'parquet':
+            assert len(gpd.read_parquet(empty_path)) == 0
+        else:
+            assert len(gpd.read_file(empty_path)) == 0
+    
+    def test_convert_shapefile_chunked_polygons(self, temp_dir):
+        """Test chunked GeoJSON through GDAL's encoder with a projected CRS and filter"""
+        gdf = gpd.GeoDataFrame(
+            {'id': list(range(5)),
+             'geometry': [Point(i * 1000, i * 1000).buffer(100) for i in range(5)]},
+            crs='EPSG:3857'
+        )
+        shp_path = os.path.join(temp_dir, 'polygons.shp')
+        gdf.to_file(shp_path)
+        output_path = os.path.join(temp_dir, 'polygons.geojson')
+        
+        convert_shapefile(shp_path, output_path, chunk_size=2, where='id > 0')
+        
+        with open(output_path, 'r') as f:
+            geojson = json.load(f)
+        assert geojson['type'] == 'FeatureCollection'
+        assert [feature['properties']['id'] for feature in geojson['features']] == [1, 2, 3, 4]
+        result_gdf = gpd.read_file(output_path)
+        assert result_gdf.crs == gdf.crs
+        assert result_gdf.geometry.geom_equals_exact(gdf.geometry[1:].reset_index(drop=True), 1e-6).all()
+    
+    def test_convert_shapefile_chunked_fgb_rejected(self, sample_point_shapefile):
+        """Test that chunking is refused for formats that can't be appended cheaply"""
+        shp_path, _ = sample_point_shapefile
+        
+        metrics = MockMetricsCollector()
+        with pytest.raises(ValueError, match='chunk_size'):
+            convert_shapefile(shp_path, metrics=metrics, output_format='fgb', chunk_size=2)
+        assert any(event[0] == 'failure' for event in metrics.events)
+    
+    def test_convert_many(self, sample_point_shapefile, sample_polygon_shapefile, temp_dir):
+        """Test parallel batch conversion replays worker metrics"""
+        point_path, _ = sample_point_shapefile
+        polygon_path, _ = sample_polygon_shapefile
+        missing_path = os.path.join(temp_dir, 'missing.shp')
+        
+        metrics = MockMetricsCollector()
+        failures = convert_many([point_path, polygon_path, missing_path], metrics, processes=2)
+        
+        assert list(failures) == [missing_path]
+        assert len(gpd.read_file(Path(point_path).with_suffix('.geojson'))) == 3
+        assert len(gpd.read_file(Path(polygon_path).with_suffix('.geojson'))) == 2
+        assert metrics.events.count('start') == 3
+        assert sum(1 for event in metrics.events if event[0] == 'success') == 2
+        assert sum(1 for event in metrics.events if event[0] == 'failure') == 1
+    
+    def test_main_batch_exit_status(self, sample_point_shapefile, temp_dir, monkeypatch):
+        """Test that the batch CLI exits non-zero when any input fails"""
+        shp_path, _ = sample_point_shapefile
+        missing_path = os.path.join(temp_dir, 'missing.shp')
+        monkeypatch.setattr('sys.argv', ['geofile', shp_path, missing_path, '-j', '2'])
+        
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 1
+    
+    def test_main_chunk_size_requires_arrow(self, sample_point_shapefile, monkeypatch, capsys):
+        """Test that --chunk-size fails up front when Arrow streaming is unavailable"""
+        import geofile.geofile as geofile_module
+        shp_path, _ = sample_point_shapefile
+        monkeypatch.setattr(geofile_module, '_io_options', lambda: ('pyogrio', False))
+        monkeypatch.setattr('sys.argv', ['geofile', shp_path, '--chunk-size', '2'])
+        
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 2
+        assert 'requires pyarrow' in capsys.readouterr().err
+    
+    def test_import_is_lazy(self):
+        """Test that importing the module does not import geopandas"""
+        import subprocess
+        import sys
+        code = (
+            "import sys; import geofile.geofile; "
+            "sys.exit('geopandas' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+
 # Performance benchmarks (optional, requires pytest-benchmark)
 class TestPerformance:
     """Performance regression tests"""